@@ -4,31 +4,45 @@ Scrape CBC RSS feeds and produce a consolidated JSON file.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
 import json
 import logging
 import os
 import sys
 import time
 import html
-import random
+import html.entities
+import io
+import multiprocessing
+import operator
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 from collections import defaultdict
+from urllib.parse import urljoin, urlparse
 
-import feedparser
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from readability import Document  # type: ignore
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from dateutil import tz
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the stdlib encoder
+    orjson = None
+
 from utils import (
     stable_id,
     parse_date,
+    published_year,
     summarize,
     compute_bias,
-    ensure_nltk_data,  # <- must exist in utils.py
 )
 
 # ------------------------------------------------------------------------------
@@ -37,7 +51,7 @@ from utils import (
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
-# Browser-like UA; close connections to avoid CDN keep-alive resets.
+# Browser-like UA so the CDN serves us like a regular reader.
 BROWSER_UA = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36"
@@ -69,84 +83,312 @@ def should_run_now(config: dict, force: bool = False) -> bool:
 # ------------------------------------------------------------------------------
 # HTTP helpers
 # ------------------------------------------------------------------------------
-def make_session() -> requests.Session:
+def make_session(max_workers: int = 4) -> requests.Session:
     s = requests.Session()
     retry = Retry(
         total=6,
         backoff_factor=0.8,  # 0.8, 1.6, 3.2, ...
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=frozenset({"GET"}),
+        connect=3,  # bound retries on CDN connection resets
+        read=3,
         raise_on_status=False,
         respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=4)
+    # Keep-alive connections are reused across feeds on the same host; size
+    # the per-host pool so concurrent section workers don't evict them.
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=8,
+        pool_maxsize=max(8, max_workers * 2),
+    )
     s.mount("http://", adapter)
     s.mount("https://", adapter)
     s.headers.update(
         {
             "User-Agent": BROWSER_UA,
             "Accept": "application/rss+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Connection": "close",
         }
     )
     return s
 
-def fetch_feed_bytes(session: requests.Session, url: str, timeout: int = 20) -> bytes:
-    time.sleep(0.8 + random.random() * 1.2)  # polite jitter
-    resp = session.get(url, timeout=timeout)
+class HostRateLimiter:
+    """Space out requests to the same host by at least ``min_interval``.
+
+    Each host gets its own schedule, so concurrent workers hitting
+    different hosts never wait on each other while any single host still
+    sees at most one request per interval.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        host = urlparse(url).netloc
+        # Reserve a slot under the lock, then sleep outside it.
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def load_json_cache(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_json_cache(path: str, cache: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+def fetch_feed_bytes(
+    session: requests.Session,
+    url: str,
+    timeout: int = 20,
+    cache: Optional[dict] = None,
+    cache_dir: Optional[str] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> Tuple[bytes, Dict[str, str]]:
+    """Fetch a feed, revalidating against the cached copy when we have one.
+
+    ``cache`` maps feed URLs to their last ``ETag``/``Last-Modified``
+    validators and the name of the body file stored in ``cache_dir``.
+    A 304 response reuses the stored body instead of re-downloading it.
+
+    Returns the body along with the response headers needed to resolve
+    relative links in the feed.
+    """
+    if limiter is not None:
+        limiter.acquire(url)
+    use_cache = cache is not None and cache_dir is not None
+    headers = {}
+    body_path = None
+    entry = cache.get(url) if use_cache else None
+    if entry:
+        body_path = os.path.join(cache_dir, entry["body_path"])
+        if os.path.exists(body_path):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = session.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and headers:
+        logger.info("Feed %s not modified; using cached copy", url)
+        with open(body_path, "rb") as f:
+            return f.read(), entry.get("headers", {})
     resp.raise_for_status()
-    return resp.content
 
-def fetch_content(session: requests.Session, url: str) -> Optional[str]:
+    feed_headers = {}
+    if resp.headers.get("Content-Location"):
+        feed_headers["content-location"] = resp.headers["Content-Location"]
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if use_cache and (etag or last_modified):
+        body_name = f"{stable_id(url)}.xml"
+        with open(os.path.join(cache_dir, body_name), "wb") as f:
+            f.write(resp.content)
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_path": body_name,
+            "headers": feed_headers,
+        }
+    return resp.content, feed_headers
+
+def fetch_content(
+    session: requests.Session,
+    url: str,
+    cache: Optional[dict] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> Optional[str]:
+    """Fetch an article page and return a summary of its visible text.
+
+    When ``cache`` is given, the summary is memoised under the URL plus a
+    digest of the page bytes, so an unchanged page is never re-parsed or
+    re-summarised.
+    """
     try:
         headers = {
             "User-Agent": BROWSER_UA,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Connection": "close",
         }
+        if limiter is not None:
+            limiter.acquire(url)
         resp = session.get(url, headers=headers, timeout=15)
         if resp.status_code != 200:
             logger.warning("Failed to fetch %s: status %s", url, resp.status_code)
             return None
-        doc = Document(resp.text)
-        return doc.summary()
+        key = None
+        if cache is not None:
+            digest = hashlib.blake2b(resp.content, digest_size=8).hexdigest()
+            key = f"{url}#{digest}"
+            hit = cache.get(key, {}).get("summary")
+            if hit:
+                return hit
+        tree = LexborHTMLParser(resp.text)
+        for node in tree.css("script, style, nav, footer, header"):
+            node.decompose()
+        if tree.body is None:
+            return None
+        summary = summarize(tree.body.text(separator=" "), max_chars=500)
+        if key is not None and summary:
+            cache[key] = {"summary": summary, "stored_at": time.time()}
+        return summary or None
     except Exception as exc:
         logger.warning("Exception fetching %s: %s", url, exc)
         return None
 
+def dump_json_bytes(obj: dict) -> bytes:
+    """Serialise ``obj`` as indented UTF-8 JSON, using orjson if available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ------------------------------------------------------------------------------
 # Scrape + normalize
 # ------------------------------------------------------------------------------
-def scrape_section(
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+BY_PUBLISHED = operator.itemgetter("published_at")
+
+# A "&" that doesn't start an entity or character reference, and named
+# entities (XML only predefines five; feeds often use HTML ones).
+_BARE_AMP_RE = re.compile(rb"&(?!#[0-9]+;|#x[0-9a-fA-F]+;|[A-Za-z][A-Za-z0-9]*;)")
+_NAMED_ENTITY_RE = re.compile(rb"&([A-Za-z][A-Za-z0-9]*);")
+_XML_ENTITIES = {b"amp", b"lt", b"gt", b"quot", b"apos"}
+
+def _to_char_ref(match: "re.Match[bytes]") -> bytes:
+    name = match.group(1)
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    chars = html.entities.html5.get(name.decode("ascii") + ";")
+    if chars is None:
+        return b"&amp;" + name + b";"
+    return "".join(f"&#{ord(c)};" for c in chars).encode("ascii")
+
+def _repair_entities(raw: bytes) -> bytes:
+    """Escape bare ampersands and turn HTML entities into character refs."""
+    raw = _BARE_AMP_RE.sub(b"&amp;", raw)
+    return _NAMED_ENTITY_RE.sub(_to_char_ref, raw)
+
+def _child_text(item: etree._Element, tag: str) -> Optional[str]:
+    # itertext() keeps text after inline markup such as <b>, which
+    # findtext() would cut off at the first child element.
+    el = item.find(tag)
+    return "".join(el.itertext()) if el is not None else None
+
+def _parse_items(raw: bytes, base_url: str, recover: bool) -> Iterator[dict]:
+    for _, item in etree.iterparse(
+        io.BytesIO(raw), events=("end",), tag="{*}item", recover=recover
+    ):
+        # Children share the item's namespace (none for RSS 2.0, the RSS 1.0
+        # namespace for RDF feeds); matching it exactly avoids picking up
+        # foreign elements such as atom:link.
+        ns = item.tag[: item.tag.index("}") + 1] if item.tag.startswith("{") else ""
+        entry = {
+            "title": _child_text(item, f"{ns}title"),
+            "link": _child_text(item, f"{ns}link"),
+            "published": _child_text(item, f"{ns}pubDate"),
+            "date": _child_text(item, DC_DATE),
+            "description": _child_text(item, f"{ns}description"),
+        }
+        if entry["link"]:
+            entry["link"] = urljoin(base_url, entry["link"].strip())
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+        yield {k: v for k, v in entry.items() if v}
+
+def _iter_entries(raw: bytes, base_url: str) -> Iterator[dict]:
+    """Stream RSS ``<item>`` elements as plain dicts.
+
+    Only the fields process_entries consumes are extracted; empty fields
+    are omitted.  Each item is cleared once read so memory stays flat
+    regardless of feed size.
+
+    The feed is parsed strictly first, because libxml2's recovery mode
+    silently drops entity text.  On a syntax error the remaining items
+    are re-read from a copy with bare ``&`` and HTML entities repaired,
+    skipping those already yielded.
+    """
+    yielded = 0
+    try:
+        for entry in _parse_items(raw, base_url, recover=False):
+            yield entry
+            yielded += 1
+        return
+    except etree.XMLSyntaxError as exc:
+        logger.warning("Malformed feed %s (%s); retrying with repaired entities", base_url, exc)
+    for i, entry in enumerate(_parse_items(_repair_entities(raw), base_url, recover=True)):
+        if i >= yielded:
+            yield entry
+
+def fetch_section(
     name: str,
     config: dict,
-    now: datetime,
-    allow_extract: bool,
     session: requests.Session,
-) -> list:
+    feed_cache: Optional[dict] = None,
+    cache_dir: Optional[str] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> Tuple[bytes, str]:
+    """Download a section's feed; returns the body and its base URL."""
     section_cfg = config["sections"][name]
     url = section_cfg["url"]
-    max_items = section_cfg["max_items"]
     logger.info("Fetching feed for section '%s' (%s)", section_cfg["name"], url)
 
-    raw = fetch_feed_bytes(session, url, timeout=20)
-    feed = feedparser.parse(raw)
+    raw, feed_headers = fetch_feed_bytes(
+        session,
+        url,
+        timeout=20,
+        cache=feed_cache,
+        cache_dir=cache_dir,
+        limiter=limiter,
+    )
+    # Content-Location may itself be relative to the request URL.
+    return raw, urljoin(url, feed_headers.get("content-location", ""))
+
+def process_entries(
+    raw: bytes,
+    base_url: str,
+    section_cfg: dict,
+    tz_name: str,
+    window_start: datetime,
+    accurate_sentiment: bool = False,
+) -> list:
+    """Normalise a fetched feed into output items.
 
+    This is the CPU-bound half of scraping a section (parsing, dates,
+    summaries, bias).  It may run in a worker process (see
+    ``process_workers``), so it must stay picklable and free of network
+    access.
+    """
     items = []
-    tz_name = config.get("timezone", "UTC")
-    window_start = now - timedelta(hours=config.get("window_hours", 24))
+    local_tz = tz.gettz(tz_name)
+    # A day of slack keeps timezone offsets around New Year from
+    # discarding entries that are actually inside the window.
+    min_year = (window_start - timedelta(days=1)).year
 
-    for entry in getattr(feed, "entries", []):
+    for entry in _iter_entries(raw, base_url):
         # Publication date
         pub_str = None
-        for key in ["published", "updated", "pubDate", "date"]:
+        for key in ("published", "date"):
             if key in entry:
                 pub_str = entry[key]
                 break
         if not pub_str:
             continue
 
-        published_at = parse_date(pub_str, tz_name)
+        year = published_year(pub_str)
+        if year is not None and year < min_year:
+            continue
+
+        published_at = parse_date(pub_str, local_tz)
         if not published_at:
             continue
 
@@ -156,15 +398,10 @@ def scrape_section(
 
         url_entry = entry.get("link")
         title = html.unescape(entry.get("title", "")).strip()
-        summary_raw = entry.get("summary") or entry.get("description") or ""
+        summary_raw = entry.get("description", "")
         summary_auto = summarize(summary_raw, max_chars=500)
 
-        if not summary_auto and allow_extract and url_entry:
-            extracted_html = fetch_content(session, url_entry)
-            if extracted_html:
-                summary_auto = summarize(extracted_html, max_chars=500)
-
-        bias = compute_bias(url_entry or "", title, summary_auto)
+        bias = compute_bias(url_entry or "", title, summary_auto, accurate_sentiment)
         items.append(
             {
                 "id": stable_id(url_entry or title),
@@ -177,10 +414,29 @@ def scrape_section(
             }
         )
 
-    items.sort(key=lambda x: x["published_at"], reverse=True)
-    return items[:max_items]
+    # Only the newest max_items survive, so avoid sorting the whole feed.
+    return heapq.nlargest(section_cfg["max_items"], items, key=BY_PUBLISHED)
+
+def extract_missing_summaries(
+    session: requests.Session,
+    items: list,
+    cache: Optional[dict] = None,
+    limiter: Optional[HostRateLimiter] = None,
+    accurate_sentiment: bool = False,
+) -> None:
+    """Fill empty summaries from the article page (``allow_extract``)."""
+    for it in items:
+        if it["summary_auto"] or not it["url"]:
+            continue
+        summary = fetch_content(session, it["url"], cache=cache, limiter=limiter)
+        if not summary:
+            continue
+        it["summary_auto"] = summary
+        it["bias_heuristic"] = compute_bias(
+            it["url"], it["title"], it["summary_auto"], accurate_sentiment
+        ).to_dict()
 
-def deduplicate(items: list) -> list:
+def deduplicate(items: Iterable[dict]) -> list:
     seen = set()
     deduped = []
     for item in items:
@@ -203,41 +459,123 @@ def main() -> None:
     config_path = os.path.join(base_dir, "config.yml")
     config = load_config(config_path)
 
-    # Ensure NLTK data on ephemeral runners
-    ensure_nltk_data()
-
     if not should_run_now(config, force=args.force):
         return
 
-    now = datetime.now(tz.gettz(config.get("timezone", "UTC")))
+    tz_name = config.get("timezone", "UTC")
+    now = datetime.now(tz.gettz(tz_name))
     allow_extract = bool(config.get("allow_extract", False))
-    all_items = []
-
-    session = make_session()
-    per_request_sleep = float(config.get("rate_limit_seconds", 1.0))
-
-    for sec_key in config.get("sections", {}):
-        try:
-            items = scrape_section(sec_key, config, now, allow_extract, session)
-            all_items.extend(items)
-        except Exception as exc:
-            logger.error("Error scraping section %s: %s", sec_key, exc)
-        finally:
-            # jittered delay between sections: (rate_limit_seconds ± 50%)
-            jitter = per_request_sleep * (0.5 + random.random())
-            time.sleep(max(0.5, jitter))
+    accurate_sentiment = bool(config.get("accurate_sentiment", False))
+
+    # Feed validators (ETag / Last-Modified) and bodies persist between runs.
+    data_dir = os.path.join(base_dir, os.pardir, "data")
+    cache_dir = os.path.join(data_dir, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    feed_cache_path = os.path.join(data_dir, "feed_cache.json")
+    feed_cache = load_json_cache(feed_cache_path)
+
+    max_workers = int(config.get("max_workers", 4))
+    session = make_session(max_workers)
+    # At most one request per rate_limit_seconds to any single host.
+    limiter = HostRateLimiter(float(config.get("rate_limit_seconds", 1.0)))
+    sections = list(config.get("sections", {}))
+
+    window_start = now - timedelta(hours=config.get("window_hours", 24))
+    # Spawning worker processes costs more than normalising a few hundred
+    # items, so the process pool is opt-in (process_workers > 0).
+    process_workers = min(len(sections), int(config.get("process_workers", 0)))
+    cpu_pool = None
+    if process_workers > 0:
+        # Spawned rather than forked since fetch threads are live.
+        cpu_pool = ProcessPoolExecutor(
+            max_workers=process_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    # Feeds are IO-bound, so fetch sections on threads; each fetched body is
+    # normalised as soon as it arrives, which overlaps with the remaining
+    # rate-limited fetches.  Results are keyed by section and re-assembled
+    # in config order to keep output stable.
+    results = {}
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as fetch_pool:
+        fetches = {
+            fetch_pool.submit(
+                fetch_section,
+                sec_key,
+                config,
+                session,
+                feed_cache,
+                cache_dir,
+                limiter,
+            ): sec_key
+            for sec_key in sections
+        }
+        for fut in as_completed(fetches):
+            sec_key = fetches[fut]
+            try:
+                raw, base_url = fut.result()
+            except Exception as exc:
+                logger.error("Error fetching section %s: %s", sec_key, exc)
+                continue
+            args = (
+                raw,
+                base_url,
+                config["sections"][sec_key],
+                tz_name,
+                window_start,
+                accurate_sentiment,
+            )
+            if cpu_pool is not None:
+                jobs[cpu_pool.submit(process_entries, *args)] = sec_key
+                continue
+            try:
+                results[sec_key] = process_entries(*args)
+            except Exception as exc:
+                logger.error("Error processing section %s: %s", sec_key, exc)
+
+    if cpu_pool is not None:
+        with cpu_pool:
+            for fut in as_completed(jobs):
+                sec_key = jobs[fut]
+                try:
+                    results[sec_key] = fut.result()
+                except Exception as exc:
+                    logger.error("Error processing section %s: %s", sec_key, exc)
+
+    if allow_extract:
+        # Extracted article text is kept for extract_ttl seconds.
+        extract_cache_path = os.path.join(data_dir, "extract_cache.json")
+        ttl = float(config.get("extract_ttl", 86400))
+        cutoff = time.time() - ttl
+        extract_cache = {
+            k: v
+            for k, v in load_json_cache(extract_cache_path).items()
+            if v.get("stored_at", 0) >= cutoff
+        }
+        for items in results.values():
+            extract_missing_summaries(
+                session,
+                items,
+                cache=extract_cache,
+                limiter=limiter,
+                accurate_sentiment=accurate_sentiment,
+            )
+        save_json_cache(extract_cache_path, extract_cache)
+    session.close()
+
+    save_json_cache(feed_cache_path, feed_cache)
 
     # ----- Opinion relabel + caps (INSIDE main) -----
     # Relabel opinions by URL pattern
-    for it in all_items:
-        if "/opinion/" in (it.get("url") or ""):
-            it["section"] = "Opinion"
+    section_lists = [results.get(sec_key, []) for sec_key in sections]
+    for items in section_lists:
+        for it in items:
+            if "/opinion/" in (it.get("url") or ""):
+                it["section"] = "Opinion"
 
-    # Sort newest → oldest
-    all_items.sort(key=lambda x: x["published_at"], reverse=True)
-
-    # Deduplicate
-    deduped = deduplicate(all_items)
+    # Each section is already newest → oldest, so merge rather than re-sort
+    # and stream straight into deduplication.
+    deduped = deduplicate(heapq.merge(*section_lists, key=BY_PUBLISHED, reverse=True))
 
     # Enforce per-section caps (Opinion=5; others from config)
     name_to_cap = {cfg["name"]: cfg["max_items"] for cfg in config.get("sections", {}).values()}
@@ -257,19 +595,18 @@ def main() -> None:
         "timezone": config.get("timezone", "UTC"),
         "items": final_items,
     }
-    data_dir = os.path.join(base_dir, os.pardir, "data")
-    os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, "latest.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    payload = dump_json_bytes(output)
+    with open(output_path, "wb") as f:
+        f.write(payload)
     logger.info("Wrote %d items to %s", len(final_items), output_path)
 
     # 👉 NEW: also mirror into /docs/data/latest.json so GitHub Pages can serve it
     docs_data_dir = os.path.join(base_dir, os.pardir, "docs", "data")
     os.makedirs(docs_data_dir, exist_ok=True)
     docs_output_path = os.path.join(docs_data_dir, "latest.json")
-    with open(docs_output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(docs_output_path, "wb") as f:
+        f.write(payload)
     logger.info("Also wrote %d items to %s", len(final_items), docs_output_path)
 
 # ------------------------------------------------------------------------------